@@ -1,19 +1,40 @@
 import json
+import sqlite3
+import time
 from datetime import datetime
 
+DB_FILE = 'students.db'
+SCHEMA_VERSION = 1
+# Files written by earlier versions; imported once, when the database is
+# first created, and never read again after user_version is set.
+DATA_FILE = 'student_records.dat'
+LOG_FILE = 'student_records.log'
+
+_COLUMNS = "id, name, grade, major, added_date"
+
+_TODAY = [0.0, '']
+
+def _today_str():
+    t = time.time()
+    if t - _TODAY[0] > 1:
+        _TODAY[:] = [t, datetime.now().strftime('%Y-%m-%d')]
+    return _TODAY[1]
+
+_NODE_FMT = "ID: {} | {:20} | Grade: {} | Major: {:15} | Added: {}".format
+
 class StudentNode:
-    def __init__(self, student_id, name, grade, major):
+    __slots__ = ('student_id', 'name', 'grade', 'major', 'added_date')
+
+    def __init__(self, student_id, name, grade, major, added_date=None):
         self.student_id = student_id
         self.name = name.strip().title()
         self.grade = grade.upper() if isinstance(grade, str) else grade
         self.major = major.strip().title()
-        self.next = None
-        self.added_date = datetime.now().strftime('%Y-%m-%d')
+        self.added_date = added_date or _today_str()
 
     def __str__(self):
-        return (f"ID: {self.student_id} | {self.name:20} | "
-                f"Grade: {self.grade} | Major: {self.major:15} | "
-                f"Added: {self.added_date}")
+        return _NODE_FMT(self.student_id, self.name, self.grade,
+                         self.major, self.added_date)
 
     def to_dict(self):
         return {
@@ -24,195 +45,225 @@ class StudentNode:
             'added_date': self.added_date
         }
 
+    def to_row(self):
+        return (self.student_id, self.name, self.grade, self.major, self.added_date)
+
+def _like_pattern(term):
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
 class StudentRecordSystem:
     def __init__(self):
-        self.head = None
-        self._counter = 0
+        self.db = sqlite3.connect(DB_FILE)
+        # SQLite's LIKE and NOCASE only fold ASCII; match names the way
+        # str.casefold() does so searches stay Unicode case-insensitive.
+        self.db.create_function("casefold", 1, str.casefold, deterministic=True)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        # In WAL mode NORMAL skips the fsync on every commit and only syncs the
+        # WAL at checkpoints. A crash of this program loses nothing, but an OS
+        # crash or power failure can roll back the most recent commits.
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS students ("
+            "id INTEGER PRIMARY KEY, name TEXT NOT NULL COLLATE NOCASE, "
+            "grade TEXT, major TEXT, added_date TEXT)"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS idx_name ON students(name)")
+        self.db.commit()
         self._load_existing_records()
 
+    def _schema_version(self):
+        return self.db.execute("PRAGMA user_version").fetchone()[0]
+
+    def _count(self):
+        return self.db.execute("SELECT COUNT(*) FROM students").fetchone()[0]
+
     def _load_existing_records(self):
         print("Loading student records...")
-        try:
-            with open('student_records.dat', 'r') as f:
-                data = json.load(f)
-                for record in reversed(data.get('records', [])):
-                    self._add_node(
-                        record['student_id'],
-                        record['name'],
-                        record['grade'],
-                        record['major'],
-                        record['added_date']
-                    )
-            print(f"✔ Loaded {self._counter} record(s) from file.")
-            self._sort_by_id()
-        except (FileNotFoundError, json.JSONDecodeError):
+        if self._schema_version() < SCHEMA_VERSION:
+            self._import_legacy_records()
+            self.db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self.db.commit()
+        count = self._count()
+        if count:
+            print(f"✔ Loaded {count} record(s) from file.")
+        else:
             print("⚠ No previous data found. Starting fresh.")
 
-    def _add_node(self, student_id, name, grade, major, added_date=None):
-        node = StudentNode(student_id, name, grade, major)
-        if added_date:
-            node.added_date = added_date
-        node.next = self.head
-        self.head = node
-        self._counter += 1
-
-    def _save_data(self):
-        records = []
-        current = self.head
-        while current:
-            records.append(current.to_dict())
-            current = current.next
-        with open('student_records.dat', 'w') as f:
-            json.dump({'records': records}, f, indent=2)
-        print(f"[INFO] Saved {len(records)} record(s) to file.")
-
-    def _sort_by_id(self):
-        if not self.head or not self.head.next:
-            return
-        sorted_head = None
-        current = self.head
-        while current:
-            next_node = current.next
-            if not sorted_head or sorted_head.student_id > current.student_id:
-                current.next = sorted_head
-                sorted_head = current
-            else:
-                temp = sorted_head
-                while temp.next and temp.next.student_id < current.student_id:
-                    temp = temp.next
-                current.next = temp.next
-                temp.next = current
-            current = next_node
-        self.head = sorted_head
-
-    def _sort_by_name(self):
-        if not self.head or not self.head.next:
-            return
-        changed = True
-        while changed:
-            changed = False
-            prev = None
-            current = self.head
-            while current.next:
-                if current.name > current.next.name:
-                    if prev:
-                        prev.next = current.next
+    def _import_legacy_records(self):
+        records = {}
+        try:
+            with open(DATA_FILE, 'r') as f:
+                for record in json.load(f).get('records', []):
+                    records[record['student_id']] = record
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+        try:
+            with open(LOG_FILE, 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        break
+                    if entry.pop('op') == 'del':
+                        records.pop(entry['student_id'], None)
                     else:
-                        self.head = current.next
-                    temp = current.next.next
-                    current.next.next = current
-                    current.next = temp
-                    prev = current.next
-                    changed = True
-                else:
-                    prev = current
-                    current = current.next
+                        records[entry['student_id']] = entry
+        except FileNotFoundError:
+            pass
+        if not records:
+            return 0
+        return self.add_many(records.values())
+
+    def _get(self, student_id):
+        row = self.db.execute(
+            f"SELECT {_COLUMNS} FROM students WHERE id = ?", (student_id,)
+        ).fetchone()
+        return StudentNode(*row) if row else None
+
+    def _select(self, where="", params=(), order_by="id", row_type=StudentNode):
+        cursor = self.db.execute(
+            f"SELECT {_COLUMNS} FROM students {where} ORDER BY {order_by}", params
+        )
+        return [row_type(*row) for row in cursor]
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
+
+    def _add_record(self, student_id, name, grade, major, added_date=None):
+        node = StudentNode(int(student_id), name, grade, major, added_date)
+        try:
+            self.db.execute(
+                "INSERT INTO students VALUES (?, ?, ?, ?, ?)", node.to_row()
+            )
+        except sqlite3.IntegrityError:
+            raise ValueError(f"Student ID {node.student_id} already exists.") from None
+        return node
+
+    def _update_record(self, student_id, fields):
+        updates = {}
+        if fields.get('name'):
+            updates['name'] = fields['name'].title()
+        if fields.get('grade'):
+            updates['grade'] = fields['grade']
+        if fields.get('major'):
+            updates['major'] = fields['major'].title()
+        if updates:
+            assignments = ", ".join(f"{column} = ?" for column in updates)
+            self.db.execute(
+                f"UPDATE students SET {assignments} WHERE id = ?",
+                (*updates.values(), int(student_id))
+            )
+        return self._get(int(student_id))
+
+    def _delete_record(self, student_id):
+        node = self._get(int(student_id))
+        if node is not None:
+            self.db.execute("DELETE FROM students WHERE id = ?", (node.student_id,))
+        return node
+
+    def add_many(self, records):
+        rows = [
+            StudentNode(
+                int(record['student_id']),
+                record['name'],
+                record['grade'],
+                record.get('major') or "Undeclared",
+                record.get('added_date')
+            ).to_row()
+            for record in records
+        ]
+        before = self.db.total_changes
+        with self.db:
+            self.db.executemany(
+                "INSERT OR IGNORE INTO students VALUES (?, ?, ?, ?, ?)", rows
+            )
+        count = self.db.total_changes - before
+        if count < len(rows):
+            print(f"Skipped {len(rows) - count} record(s).")
+        return count
 
     def add_student(self):
         print("\n[Add Student Record]")
         while True:
-            student_id = input("Student ID: ").strip()
-            if not student_id.isdigit():
+            raw = input("Student ID: ").strip()
+            if not raw.isdigit():
                 print("Please enter a valid numeric ID.")
                 continue
-            node = self.head
-            while node:
-                if str(node.student_id) == student_id:
-                    print(f"Student ID {student_id} already exists.")
-                    break
-                node = node.next
-            else:
-                break
+            student_id = int(raw)
+            if self._get(student_id) is not None:
+                print(f"Student ID {student_id} already exists.")
+                continue
+            break
         name = input("Full Name: ").strip()
         while not name:
             print("Name cannot be empty.")
             name = input("Full Name: ").strip()
         grade = input("Grade (A-F or numeric): ").upper()
         major = input("Major: ") or "Undeclared"
-        self._add_node(int(student_id), name, grade, major)
+        with self.db:
+            self._add_record(student_id, name, grade, major)
         print(f"✅ Student '{name}' added successfully.")
-        self._save_data()
 
     def search_student(self, term):
-        results = []
-        current = self.head
-        while current:
-            if term.lower() in current.name.lower() or term == str(current.student_id):
-                results.append(current)
-            current = current.next
-        return results
+        is_id = term.isascii() and term.isdigit() and str(int(term)) == term
+        student_id = int(term) if is_id else None
+        return self._select("WHERE casefold(name) LIKE ? ESCAPE '\\' OR id = ?",
+                            (_like_pattern(term.casefold()), student_id))
 
     def update_student(self, student_id):
-        current = self.head
-        while current:
-            if str(current.student_id) == str(student_id):
-                print(f"Current Record:\n{current}\n")
-                name = input(f"Name ({current.name}): ").strip()
-                if name:
-                    current.name = name.title()
-                grade = input(f"Grade ({current.grade}): ").strip().upper()
-                if grade:
-                    current.grade = grade
-                major = input(f"Major ({current.major}): ").strip()
-                if major:
-                    current.major = major.title()
-                print("✅ Record updated successfully.")
-                self._save_data()
-                return
-            current = current.next
-        print(f"❌ No student found with ID {student_id}")
+        current = self._get(student_id)
+        if current is None:
+            print(f"❌ No student found with ID {student_id}")
+            return
+        print(f"Current Record:\n{current}\n")
+        fields = {
+            'name': input(f"Name ({current.name}): ").strip(),
+            'grade': input(f"Grade ({current.grade}): ").strip().upper(),
+            'major': input(f"Major ({current.major}): ").strip(),
+        }
+        with self.db:
+            self._update_record(current.student_id, fields)
+        print("✅ Record updated successfully.")
 
     def delete_student(self, student_id):
-        prev = None
-        current = self.head
-        while current:
-            if str(current.student_id) == str(student_id):
-                if prev:
-                    prev.next = current.next
-                else:
-                    self.head = current.next
-                print(f"🗑 Deleted record for {current.name} (ID: {current.student_id})")
-                self._counter -= 1
-                self._save_data()
-                return
-            prev = current
-            current = current.next
-        print(f"❌ No student found with ID {student_id}")
+        with self.db:
+            current = self._delete_record(student_id)
+        if current is None:
+            print(f"❌ No student found with ID {student_id}")
+            return
+        print(f"🗑 Deleted record for {current.name} (ID: {current.student_id})")
 
     def display_all(self, sort_by='id'):
-        if not self.head:
-            print("\nNo student records found.")
-            return
         if sort_by.lower() == 'name':
-            self._sort_by_name()
-            print("\nStudent Records (Sorted by Name)")
+            lines = self._select(order_by="name, id", row_type=_NODE_FMT)
+            title = "\nStudent Records (Sorted by Name)"
         else:
-            self._sort_by_id()
-            print("\nStudent Records (Sorted by ID)")
+            lines = self._select(row_type=_NODE_FMT)
+            title = "\nStudent Records (Sorted by ID)"
+        if not lines:
+            print("\nNo student records found.")
+            return
+        print(title)
         print("=" * 80)
-        current = self.head
-        while current:
-            print(current)
-            current = current.next
-        print(f"\nTotal records: {self._counter}")
+        print("\n".join(lines))
+        print(f"\nTotal records: {len(lines)}")
 
     def export_to_text(self, filename="student_records.txt"):
-        if not self.head:
+        lines = self._select(row_type=_NODE_FMT)
+        if not lines:
             print("No records to export.")
             return
         with open(filename, 'w') as f:
             f.write("Student Records\n")
             f.write("=" * 50 + "\n")
             f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n")
-            current = self.head
-            while current:
-                f.write(str(current) + "\n")
-                current = current.next
+            f.write("\n".join(lines))
+            f.write("\n")
         print(f"📁 Records exported to {filename}")
 
-def run_cli():
-    system = StudentRecordSystem()
-    HELP = """
+HELP = """
 Commands:
   add      - Add a new student
   search   - Search student by ID or name
@@ -223,44 +274,78 @@ Commands:
   help     - Show commands
   exit     - Exit the program
 """
+
+def _h_exit(system, rest):
+    system.close()
+    print("👋 Goodbye!")
+    return True
+
+def _h_help(system, rest):
+    print(HELP)
+
+def _h_add(system, rest):
+    system.add_student()
+
+def _h_search(system, rest):
+    term = input("Search by name or ID: ").strip()
+    results = system.search_student(term)
+    if results:
+        print("\nSearch Results:")
+        print("=" * 80)
+        print("\n".join(map(str, results)))
+    else:
+        print("No matching records found.")
+
+def _read_id(prompt):
+    try:
+        return int(input(prompt).strip())
+    except ValueError:
+        print("Please enter a valid numeric ID.")
+        return None
+
+def _h_update(system, rest):
+    student_id = _read_id("Enter ID to update: ")
+    if student_id is not None:
+        system.update_student(student_id)
+
+def _h_delete(system, rest):
+    student_id = _read_id("Enter ID to delete: ")
+    if student_id is not None:
+        system.delete_student(student_id)
+
+def _h_display(system, rest):
+    args = rest.split()
+    sort_key = args[0] if args else 'id'
+    system.display_all(sort_key)
+
+def _h_export(system, rest):
+    filename = input("Filename [student_records.txt]: ").strip() or "student_records.txt"
+    system.export_to_text(filename)
+
+CMDS = {
+    'exit': _h_exit,
+    'help': _h_help,
+    'add': _h_add,
+    'search': _h_search,
+    'update': _h_update,
+    'delete': _h_delete,
+    'display': _h_display,
+    'export': _h_export,
+}
+
+def run_cli():
+    system = StudentRecordSystem()
     print("\nWelcome to the Student Record Management System")
     print(HELP)
     while True:
         try:
             cmd = input("\n> ").strip().lower()
-            if cmd == 'exit':
-                system._save_data()
-                print("👋 Goodbye!")
-                break
-            elif cmd == 'help':
-                print(HELP)
-            elif cmd == 'add':
-                system.add_student()
-            elif cmd == 'search':
-                term = input("Search by name or ID: ").strip()
-                results = system.search_student(term)
-                if results:
-                    print("\nSearch Results:")
-                    print("=" * 80)
-                    for r in results:
-                        print(r)
-                else:
-                    print("No matching records found.")
-            elif cmd == 'update':
-                student_id = input("Enter ID to update: ").strip()
-                system.update_student(student_id)
-            elif cmd == 'delete':
-                student_id = input("Enter ID to delete: ").strip()
-                system.delete_student(student_id)
-            elif cmd.startswith('display'):
-                _, *args = cmd.split()
-                sort_key = args[0] if args else 'id'
-                system.display_all(sort_key)
-            elif cmd == 'export':
-                filename = input("Filename [student_records.txt]: ").strip() or "student_records.txt"
-                system.export_to_text(filename)
-            else:
+            head, _, rest = cmd.partition(' ')
+            handler = CMDS.get(head)
+            if handler is None:
                 print("Unknown command. Type 'help' for a list of commands.")
+            elif handler(system, rest):
+                break
         except KeyboardInterrupt:
             print("\nUse 'exit' to quit safely.")
         except Exception as e: